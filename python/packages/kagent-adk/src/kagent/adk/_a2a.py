@@ -20,6 +20,7 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
+from kagent.core import KAGENT_HTTP_TIMEOUT
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -88,6 +89,7 @@ class KAgentApp:
             http_client = httpx.AsyncClient(
                 # TODO: add user  and agent headers
                 base_url=kagent_url_override or self.kagent_url,
+                timeout=KAGENT_HTTP_TIMEOUT,
                 event_hooks=token_service.event_hooks(),
             )
             session_service = KAgentSessionService(http_client)
@@ -63,6 +63,8 @@ class A2aAgentExecutor(AgentExecutor):
         super().__init__()
         self._runner = runner
         self._config = config
+        # Resolved once; the config does not change over the executor's lifetime
+        self._stream = config.stream if config is not None else False
 
     async def _resolve_runner(self) -> Runner:
         """Resolve the runner, handling cases where it's a callable that returns a Runner."""
@@ -110,8 +112,7 @@ class A2aAgentExecutor(AgentExecutor):
             raise ValueError("A2A request must have a message")
 
         # Convert the a2a request to ADK run args
-        stream = self._config.stream if self._config is not None else False
-        run_args = convert_a2a_request_to_adk_run_args(context, stream=stream)
+        run_args = convert_a2a_request_to_adk_run_args(context, stream=self._stream)
 
         # Prepare span attributes.
         span_attributes = {}
@@ -2,6 +2,7 @@ import logging
 from typing import Any, Optional
 
 import httpx
+import orjson
 from google.adk.events.event import Event
 from google.adk.sessions import Session
 from google.adk.sessions.base_session_service import (
@@ -51,7 +52,7 @@ class KAgentSessionService(BaseSessionService):
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("data"):
             raise RuntimeError(f"Failed to create session: {data.get('message', 'Unknown error')}")
 
@@ -93,7 +94,7 @@ class KAgentSessionService(BaseSessionService):
                 return None
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if not data.get("data"):
                 return None
 
@@ -131,7 +132,7 @@ class KAgentSessionService(BaseSessionService):
         response = await self.client.get(f"/api/sessions?user_id={user_id}", headers={"X-User-ID": user_id})
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         sessions_data = data.get("data", [])
 
         # Convert to ADK Session format
@@ -50,7 +50,7 @@ def initialize_session_path(session_id: str, skills_directory: str) -> Path:
         except FileExistsError:
             # Symlink already exists (race condition from concurrent session setup)
             pass
-        except Exception as e:
+        except OSError as e:
             # Log but don't fail - skills can still be accessed via absolute path
             logger.warning(f"Failed to create skills symlink for session {session_id}: {e}")
 
@@ -1,10 +1,11 @@
 import asyncio
+import concurrent.futures
 import importlib
-import json
 import logging
 import os
 from typing import Annotated, Optional
 
+import orjson
 import typer
 import uvicorn
 from a2a.types import AgentCard
@@ -15,7 +16,7 @@ from google.adk.cli.utils.agent_loader import AgentLoader
 from kagent.core import KAgentConfig, configure_logging, configure_tracing
 
 from . import AgentConfig, KAgentApp
-from .skill_fetcher import fetch_skill
+from .skill_fetcher import fetch_skill, skill_name_from_image
 from .tools import add_skills_tool_to_agent
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,9 @@ kagent_url_override = os.getenv("KAGENT_URL")
 sts_well_known_uri = os.getenv("STS_WELL_KNOWN_URI")
 propagate_token = os.getenv("KAGENT_PROPAGATE_TOKEN")
 
+# Upper bound on concurrent krane exports in pull-skills
+_MAX_SKILL_PULL_WORKERS = 4
+
 
 def create_sts_integration() -> Optional[ADKTokenPropagationPlugin]:
     if sts_well_known_uri or propagate_token:
@@ -37,6 +41,13 @@ def create_sts_integration() -> Optional[ADKTokenPropagationPlugin]:
         return ADKTokenPropagationPlugin(sts_integration)
 
 
+def load_agent_config(config_path: str) -> AgentConfig:
+    # Validate straight from the raw bytes: pydantic's JSON path parses and
+    # validates in one pass instead of building an intermediate dict first.
+    with open(config_path, "rb") as f:
+        return AgentConfig.model_validate_json(f.read())
+
+
 def maybe_add_skills(root_agent: BaseAgent):
     skills_directory = os.getenv("KAGENT_SKILLS_FOLDER", None)
     if skills_directory:
@@ -54,11 +65,9 @@ def static(
 ):
     app_cfg = KAgentConfig()
 
-    with open(os.path.join(filepath, "config.json"), "r") as f:
-        config = json.load(f)
-    agent_config = AgentConfig.model_validate(config)
-    with open(os.path.join(filepath, "agent-card.json"), "r") as f:
-        agent_card = json.load(f)
+    agent_config = load_agent_config(os.path.join(filepath, "config.json"))
+    with open(os.path.join(filepath, "agent-card.json"), "rb") as f:
+        agent_card = orjson.loads(f.read())
     agent_card = AgentCard.model_validate(agent_card)
     plugins = None
     sts_integration = create_sts_integration()
@@ -103,8 +112,21 @@ def pull_skills(
 ):
     skill_dir = os.environ.get("KAGENT_SKILLS_FOLDER", ".")
     logger.info("Pulling skills")
+    # Skills from different repositories with the same final segment extract into the same
+    # folder, so pull each folder's skills in order and only run distinct folders concurrently
+    skills_by_folder: dict[str, list[str]] = {}
     for skill in skills:
-        fetch_skill(skill, skill_dir, insecure)
+        skills_by_folder.setdefault(skill_name_from_image(skill), []).append(skill)
+
+    def _pull_folder(folder_skills: list[str]) -> None:
+        for skill in folder_skills:
+            fetch_skill(skill, skill_dir, insecure)
+
+    max_workers = max(min(len(skills_by_folder), _MAX_SKILL_PULL_WORKERS), 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_pull_folder, folder_skills) for folder_skills in skills_by_folder.values()]
+        for future in futures:
+            future.result()
 
 
 def add_to_agent(sts_integration: ADKTokenPropagationPlugin, agent: BaseAgent):
@@ -162,14 +184,12 @@ def run(
     agent_config = None
     config_path = os.path.join(working_dir, name, "config.json")
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        agent_config = AgentConfig.model_validate(config)
+        agent_config = load_agent_config(config_path)
     except FileNotFoundError:
         logger.debug(f"No config.json found at {config_path}, using defaults")
 
-    with open(os.path.join(working_dir, name, "agent-card.json"), "r") as f:
-        agent_card = json.load(f)
+    with open(os.path.join(working_dir, name, "agent-card.json"), "rb") as f:
+        agent_card = orjson.loads(f.read())
     agent_card = AgentCard.model_validate(agent_card)
 
     # Attempt to import optional user-defined lifespan(app) from the agent package
@@ -228,14 +248,11 @@ def test(
     task: Annotated[str, typer.Option("--task", help="The task to test the agent with")],
     filepath: Annotated[str, typer.Option("--filepath", help="The path to the agent config file")],
 ):
-    with open(os.path.join(filepath, "config.json"), "r") as f:
-        content = f.read()
-        config = json.loads(content)
+    agent_config = load_agent_config(os.path.join(filepath, "config.json"))
 
-    with open(os.path.join(filepath, "agent-card.json"), "r") as f:
-        agent_card = json.load(f)
+    with open(os.path.join(filepath, "agent-card.json"), "rb") as f:
+        agent_card = orjson.loads(f.read())
     agent_card = AgentCard.model_validate(agent_card)
-    agent_config = AgentConfig.model_validate(config)
     asyncio.run(test_agent(agent_config, agent_card, task))
 
 
@@ -29,6 +29,18 @@ from .part_converter import (
 
 ARTIFACT_ID_SEPARATOR = "-"
 
+_APP_NAME_KEY = get_kagent_metadata_key("app_name")
+_USER_ID_KEY = get_kagent_metadata_key("user_id")
+_SESSION_ID_KEY = get_kagent_metadata_key("session_id")
+_INVOCATION_ID_KEY = get_kagent_metadata_key("invocation_id")
+_AUTHOR_KEY = get_kagent_metadata_key("author")
+
+# Optional event fields copied into the context metadata, paired with their metadata keys
+_OPTIONAL_METADATA_FIELDS = tuple(
+    (field_name, get_kagent_metadata_key(field_name))
+    for field_name in ("branch", "grounding_metadata", "custom_metadata", "usage_metadata", "error_code")
+)
+
 # Logger
 logger = logging.getLogger("kagent_adk." + __name__)
 
@@ -71,25 +83,18 @@ def _get_context_metadata(event: Event, invocation_context: InvocationContext) -
 
     try:
         metadata = {
-            get_kagent_metadata_key("app_name"): invocation_context.app_name,
-            get_kagent_metadata_key("user_id"): invocation_context.user_id,
-            get_kagent_metadata_key("session_id"): invocation_context.session.id,
-            get_kagent_metadata_key("invocation_id"): event.invocation_id,
-            get_kagent_metadata_key("author"): event.author,
+            _APP_NAME_KEY: invocation_context.app_name,
+            _USER_ID_KEY: invocation_context.user_id,
+            _SESSION_ID_KEY: invocation_context.session.id,
+            _INVOCATION_ID_KEY: event.invocation_id,
+            _AUTHOR_KEY: event.author,
         }
 
         # Add optional metadata fields if present
-        optional_fields = [
-            ("branch", event.branch),
-            ("grounding_metadata", event.grounding_metadata),
-            ("custom_metadata", event.custom_metadata),
-            ("usage_metadata", event.usage_metadata),
-            ("error_code", event.error_code),
-        ]
-
-        for field_name, field_value in optional_fields:
+        for field_name, metadata_key in _OPTIONAL_METADATA_FIELDS:
+            field_value = getattr(event, field_name)
             if field_value is not None:
-                metadata[get_kagent_metadata_key(field_name)] = _serialize_metadata_value(field_value)
+                metadata[metadata_key] = _serialize_metadata_value(field_value)
 
         return metadata
 
@@ -158,11 +163,10 @@ def convert_event_to_a2a_message(
         return None
 
     try:
-        a2a_parts = []
-        for part in event.content.parts:
-            a2a_part = convert_genai_part_to_a2a_part(part)
-            if a2a_part:
-                a2a_parts.append(a2a_part)
+        a2a_parts = [a2a_part for part in event.content.parts if (a2a_part := convert_genai_part_to_a2a_part(part))]
+        # Only function calls named in long_running_tool_ids get marked, so skip the scan for ordinary events
+        if event.long_running_tool_ids:
+            for a2a_part in a2a_parts:
                 _process_long_running_tool(a2a_part, event)
 
         if a2a_parts:
@@ -56,6 +56,12 @@ def _parse_image_ref(image: str) -> Tuple[str, str, str]:
     return registry, repo, ref
 
 
+def skill_name_from_image(skill_image: str) -> str:
+    """Return the skill name for an image reference, i.e. the last segment of its repository."""
+    _, repo, _ = _parse_image_ref(skill_image)
+    return repo.split("/")[-1]
+
+
 def fetch_using_krane_to_dir(image: str, destination_folder: str, insecure: bool = False) -> None:
     """Fetch a skill using krane and extract it to destination_folder."""
     import subprocess
@@ -94,8 +100,7 @@ def fetch_skill(skill_image: str, destination_folder: str, insecure: bool = Fals
     registry, repo, ref = _parse_image_ref(skill_image)
 
     # skill name is the last part of the repo
-    repo_parts = repo.split("/")
-    skill_name = repo_parts[-1]
+    skill_name = skill_name_from_image(skill_image)
     logger.info(
         f"about to fetching skill {skill_name} from image {skill_image} (registry: {registry}, repo: {repo}, ref: {ref})"
     )
@@ -1,7 +1,7 @@
-from ._config import KAgentConfig
+from ._config import KAGENT_HTTP_TIMEOUT, KAgentConfig
 from ._logging import configure_logging
 from .tracing import configure as configure_tracing
 
 configure_logging()
 
-__all__ = ["KAgentConfig", "configure_tracing", "configure_logging"]
+__all__ = ["KAGENT_HTTP_TIMEOUT", "KAgentConfig", "configure_tracing", "configure_logging"]
@@ -1,9 +1,15 @@
 import os
 
+import httpx
+
 kagent_url = os.getenv("KAGENT_URL")
 kagent_name = os.getenv("KAGENT_NAME")
 kagent_namespace = os.getenv("KAGENT_NAMESPACE")
 
+# Timeouts for clients of the KAgent backend API. Connect keeps httpx's 5s default;
+# read, write and pool are raised from 5s so large session and checkpoint payloads fit.
+KAGENT_HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=10.0)
+
 
 class KAgentConfig:
     _url: str
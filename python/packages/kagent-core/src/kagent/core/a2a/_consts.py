@@ -1,3 +1,5 @@
+import functools
+
 A2A_DATA_PART_METADATA_TYPE_KEY = "type"
 A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY = "is_long_running"
 A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL = "function_call"
@@ -8,6 +10,7 @@ A2A_DATA_PART_METADATA_TYPE_EXECUTABLE_CODE = "executable_code"
 KAGENT_METADATA_KEY_PREFIX = "kagent_"
 
 
+@functools.lru_cache(maxsize=64)
 def get_kagent_metadata_key(key: str) -> str:
     """Gets the A2A event metadata key for the given key.
 
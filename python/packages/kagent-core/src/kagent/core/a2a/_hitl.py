@@ -41,8 +41,10 @@ logger = logging.getLogger(__name__)
 DecisionType = Literal["approve", "deny", "reject"]
 """Type for user decisions in HITL workflows."""
 
+_TOOL_APPROVAL_HEADER = "**Approval Required**\n\nThe following actions require your approval:\n\n"
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolApprovalRequest:
     """Generic structure for a tool call requiring approval.
 
@@ -130,13 +132,18 @@ def extract_decision_from_text(text: str) -> DecisionType | None:
     """
     text_lower = text.lower()
 
+    # Plain loops rather than any(<genexpr>): the keyword lists are short, so
+    # the generator setup costs more than the substring checks themselves
+
     # Check deny keywords first (safer - prevents accidental approval)
-    if any(keyword in text_lower for keyword in KAGENT_HITL_RESUME_KEYWORDS_DENY):
-        return KAGENT_HITL_DECISION_TYPE_DENY
+    for keyword in KAGENT_HITL_RESUME_KEYWORDS_DENY:
+        if keyword in text_lower:
+            return KAGENT_HITL_DECISION_TYPE_DENY
 
     # Check approve keywords
-    if any(keyword in text_lower for keyword in KAGENT_HITL_RESUME_KEYWORDS_APPROVE):
-        return KAGENT_HITL_DECISION_TYPE_APPROVE
+    for keyword in KAGENT_HITL_RESUME_KEYWORDS_APPROVE:
+        if keyword in text_lower:
+            return KAGENT_HITL_DECISION_TYPE_APPROVE
 
     return None
 
@@ -160,31 +167,19 @@ def extract_decision_from_message(message: Message | None) -> DecisionType | Non
     if not message or not message.parts:
         return None
 
-    # Priority 1: Scan all parts for DataPart with decision (most reliable)
-    for part in message.parts:
-        # Access .root for RootModel union types
-        if not hasattr(part, "root"):
-            continue
+    # Access .root for RootModel union types
+    roots = [getattr(part, "root", None) for part in message.parts]
 
-        inner = part.root
-
-        if isinstance(inner, DataPart):
-            decision = extract_decision_from_data_part(inner.data)
-            if decision:
-                return decision
+    # Priority 1: Scan all parts for DataPart with decision (most reliable)
+    for inner in roots:
+        if isinstance(inner, DataPart) and (decision := extract_decision_from_data_part(inner.data)):
+            return decision
 
     # Priority 2: Fallback to TextPart keyword matching
-    for part in message.parts:
-        if not hasattr(part, "root"):
-            continue
-
-        inner = part.root
-
-        if isinstance(inner, TextPart):
-            if inner.text and isinstance(inner.text, str):
-                decision = extract_decision_from_text(inner.text)
-                if decision:
-                    return decision
+    for inner in roots:
+        if isinstance(inner, TextPart) and isinstance(inner.text, str) and inner.text:
+            if decision := extract_decision_from_text(inner.text):
+                return decision
 
     return None
 
@@ -203,11 +198,9 @@ def format_tool_approval_text_parts(
     Returns:
         List of Part objects containing formatted approval message
     """
-    parts = []
-
-    # Add header
-    parts.append(Part(TextPart(text="**Approval Required**\n\n")))
-    parts.append(Part(TextPart(text="The following actions require your approval:\n\n")))
+    # Build the text fragments first and wrap them in a single part; clients
+    # concatenate text parts anyway, so this avoids a Part/TextPart pair per line
+    lines = [_TOOL_APPROVAL_HEADER]
 
     # List each action
     for action in action_requests:
@@ -216,17 +209,16 @@ def format_tool_approval_text_parts(
 
         # Escape backticks to prevent markdown breaking
         escaped_tool_name = escape_markdown_backticks(tool_name)
-        parts.append(Part(TextPart(text=f"**Tool**: `{escaped_tool_name}`\n")))
-        parts.append(Part(TextPart(text="**Arguments**:\n")))
+        lines.append(f"**Tool**: `{escaped_tool_name}`\n**Arguments**:\n")
 
         for key, value in tool_args.items():
             escaped_key = escape_markdown_backticks(key)
             escaped_value = escape_markdown_backticks(value)
-            parts.append(Part(TextPart(text=f"  • {escaped_key}: `{escaped_value}`\n")))
+            lines.append(f"  • {escaped_key}: `{escaped_value}`\n")
 
-        parts.append(Part(TextPart(text="\n")))
+        lines.append("\n")
 
-    return parts
+    return [Part(TextPart(text="".join(lines)))]
 
 
 # High-level handlers
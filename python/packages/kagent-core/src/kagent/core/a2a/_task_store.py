@@ -63,7 +63,12 @@ class KAgentTaskStore(TaskStore):
         history = task.history or []
         task.history = self._clean_partial_events(history)
 
-        response = await self.client.post("/api/tasks", json=task.model_dump(mode="json"))
+        # Serialize with pydantic's JSON encoder directly rather than dumping to a dict for the stdlib encoder
+        response = await self.client.post(
+            "/api/tasks",
+            content=task.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
 
         # Signal that save completed (event-based sync)
@@ -90,7 +95,7 @@ class KAgentTaskStore(TaskStore):
         response.raise_for_status()
 
         # Unwrap the StandardResponse envelope from the Go controller
-        wrapped = KAgentTaskResponse.model_validate(response.json())
+        wrapped = KAgentTaskResponse.model_validate_json(response.content)
         return wrapped.data
 
     @override
@@ -0,0 +1,20 @@
+"""Tests for A2A metadata key helpers."""
+
+import pytest
+
+from kagent.core.a2a import get_kagent_metadata_key
+
+
+def test_get_kagent_metadata_key():
+    """Test keys are prefixed and repeated lookups return the cached string."""
+    assert get_kagent_metadata_key("app_name") == "kagent_app_name"
+    assert get_kagent_metadata_key("app_name") is get_kagent_metadata_key("app_name")
+
+
+def test_get_kagent_metadata_key_empty():
+    """Test empty keys are rejected on every call, not cached."""
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            get_kagent_metadata_key("")
+    with pytest.raises(ValueError):
+        get_kagent_metadata_key(None)
@@ -131,15 +131,23 @@ def test_format_tool_approval_text_parts():
     ]
     parts = format_tool_approval_text_parts(requests)
 
-    # Convert to text
-    text_content = ""
-    for p in parts:
-        if hasattr(p, "root") and hasattr(p.root, "text"):
-            text_content += p.root.text
-
-    # Check structure and content
-    assert "Approval Required" in text_content
-    assert "search" in text_content
-    assert "reset" in text_content
-    # Check backticks are escaped
-    assert "\\`" in text_content
+    # The whole message is emitted as a single text part
+    assert len(parts) == 1
+    assert isinstance(parts[0].root, TextPart)
+
+    # Check structure and content, with backticks escaped
+    assert parts[0].root.text == (
+        "**Approval Required**\n\n"
+        "The following actions require your approval:\n\n"
+        "**Tool**: `search`\n"
+        "**Arguments**:\n"
+        "  • query: `test`\n"
+        "\n"
+        "**Tool**: `run\\`code\\``\n"
+        "**Arguments**:\n"
+        "  • cmd: `echo \\`test\\``\n"
+        "\n"
+        "**Tool**: `reset`\n"
+        "**Arguments**:\n"
+        "\n"
+    )
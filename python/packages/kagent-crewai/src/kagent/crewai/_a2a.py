@@ -1,6 +1,8 @@
+import asyncio
 import faulthandler
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Union
 
 import httpx
@@ -12,7 +14,7 @@ from fastapi.responses import PlainTextResponse
 from opentelemetry.instrumentation.crewai import CrewAIInstrumentor
 
 from crewai import Crew, Flow
-from kagent.core import KAgentConfig, configure_tracing
+from kagent.core import KAGENT_HTTP_TIMEOUT, KAgentConfig, configure_tracing
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -37,6 +39,18 @@ def thread_dump(request: Request) -> PlainTextResponse:
     return PlainTextResponse(buf.read())
 
 
+def _http_client_lifespan(http_client: httpx.AsyncClient, sync_http_client: httpx.Client):
+    """Returns a lifespan that closes the shared HTTP clients on shutdown."""
+
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI):
+        yield
+        await asyncio.to_thread(sync_http_client.close)
+        await http_client.aclose()
+
+    return _lifespan
+
+
 class KAgentApp:
     def __init__(
         self,
@@ -54,13 +68,15 @@ class KAgentApp:
         self.tracing = tracing
 
     def build(self) -> FastAPI:
-        http_client = httpx.AsyncClient(base_url=self.config.url)
+        http_client = httpx.AsyncClient(base_url=self.config.url, timeout=KAGENT_HTTP_TIMEOUT)
+        sync_http_client = httpx.Client(base_url=self.config.url, timeout=KAGENT_HTTP_TIMEOUT)
 
         agent_executor = CrewAIAgentExecutor(
             crew=self._crew,
             app_name=self.config.app_name,
             config=self.executor_config,
             http_client=http_client,
+            sync_http_client=sync_http_client,
         )
 
         task_store = KAgentTaskStore(http_client)
@@ -83,6 +99,7 @@ class KAgentApp:
             title=f"KAgent CrewAI: {self.config.app_name}",
             description=f"CrewAI agent with KAgent integration: {self.agent_card.description}",
             version=self.agent_card.version,
+            lifespan=_http_client_lifespan(http_client, sync_http_client),
         )
 
         if self.tracing:
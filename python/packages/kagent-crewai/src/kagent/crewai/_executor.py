@@ -47,12 +47,15 @@ class CrewAIAgentExecutor(AgentExecutor):
         app_name: str,
         config: CrewAIAgentExecutorConfig | None = None,
         http_client: httpx.AsyncClient,
+        sync_http_client: httpx.Client,
     ):
         super().__init__()
         self._crew = crew
         self.app_name = app_name
         self._config = config or CrewAIAgentExecutorConfig()
         self._http_client = http_client
+        # CrewAI's persistence and memory hooks are synchronous, so they share this pooled client
+        self._sync_http_client = sync_http_client
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
@@ -125,7 +128,7 @@ class CrewAIAgentExecutor(AgentExecutor):
                     persistence = KagentFlowPersistence(
                         thread_id=session_id,
                         user_id=user_id,
-                        base_url=str(self._http_client.base_url),
+                        client=self._sync_http_client,
                     )
                     flow_instance = flow_class()
                     flow_instance.persistence = persistence
@@ -143,7 +146,7 @@ class CrewAIAgentExecutor(AgentExecutor):
                             KagentMemoryStorage(
                                 thread_id=session_id,
                                 user_id=user_id,
-                                base_url=str(self._http_client.base_url),
+                                client=self._sync_http_client,
                             )
                         )
                     result = await self._crew.kickoff_async(inputs=inputs)
@@ -24,10 +24,10 @@ class KagentFlowPersistence(FlowPersistence):
     It saves and loads the flow state to the Kagent backend.
     """
 
-    def __init__(self, thread_id: str, user_id: str, base_url: str):
+    def __init__(self, thread_id: str, user_id: str, client: httpx.Client):
         self.thread_id = thread_id
         self.user_id = user_id
-        self.base_url = base_url
+        self.client = client
 
     def init_db(self) -> None:
         """This is handled by the Kagent backend, so no action is needed here."""
@@ -35,7 +35,7 @@ class KagentFlowPersistence(FlowPersistence):
 
     def save_state(self, flow_uuid: str, method_name: str, state_data: Union[Dict[str, Any], BaseModel]) -> None:
         """Saves the flow state to the Kagent backend."""
-        url = f"{self.base_url}/api/crewai/flows/state"
+        url = "/api/crewai/flows/state"
         payload = KagentFlowStatePayload(
             thread_id=self.thread_id,
             flow_uuid=flow_uuid,
@@ -45,22 +45,20 @@ class KagentFlowPersistence(FlowPersistence):
         logging.info(f"Saving flow state to Kagent backend: {payload}")
 
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=payload.model_dump(), headers={"X-User-ID": self.user_id})
-                response.raise_for_status()
+            response = self.client.post(url, json=payload.model_dump(), headers={"X-User-ID": self.user_id})
+            response.raise_for_status()
         except httpx.HTTPError as e:
             logging.error(f"Error saving flow state to Kagent backend: {e}")
             raise
 
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Loads the flow state from the Kagent backend."""
-        url = f"{self.base_url}/api/crewai/flows/state"
+        url = "/api/crewai/flows/state"
         params = {"thread_id": self.thread_id, "flow_uuid": flow_uuid}
         logging.info(f"Loading flow state from Kagent backend with params: {params}")
 
         try:
-            with httpx.Client() as client:
-                response = client.get(url, params=params, headers={"X-User-ID": self.user_id})
+            response = self.client.get(url, params=params, headers={"X-User-ID": self.user_id})
             if response.status_code == 404:
                 return None
             response.raise_for_status()
@@ -14,7 +14,7 @@ from a2a.types import AgentCard
 from fastapi import FastAPI, Request
 from fastapi.responses import PlainTextResponse
 
-from kagent.core import KAgentConfig, configure_tracing
+from kagent.core import KAGENT_HTTP_TIMEOUT, KAgentConfig, configure_tracing
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -83,7 +83,7 @@ class KAgentApp:
             Configured FastAPI application ready for deployment
         """
         # Create HTTP client for KAgent API
-        http_client = httpx.AsyncClient(base_url=self.config.url)
+        http_client = httpx.AsyncClient(base_url=self.config.url, timeout=KAGENT_HTTP_TIMEOUT)
 
         # Create agent executor
         agent_executor = LangGraphAgentExecutor(
@@ -170,7 +170,7 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         )
         response.raise_for_status()
 
-        logger.debug(f"Stored checkpoint {checkpoint['id']} for thread {thread_id}")
+        logger.debug("Stored checkpoint %s for thread %s", checkpoint["id"], thread_id)
 
         return {
             "configurable": {
@@ -223,7 +223,7 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         )
         response.raise_for_status()
 
-        logger.debug(f"Stored writes for checkpoint {checkpoint_id} for thread {thread_id}")
+        logger.debug("Stored writes for checkpoint %s for thread %s", checkpoint_id, thread_id)
 
     def _convert_to_checkpoint_tuple(
         self, config: RunnableConfig, checkpoint_tuple: KAgentCheckpointTuple
@@ -365,7 +365,7 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         elif isinstance(current, int):
             current_v = current
         else:
-            current_v = int(current.split(".")[0])
+            current_v = int(current.partition(".")[0])
         next_v = current_v + 1
         next_h = random.random()
         return f"{next_v:032}.{next_h:016}"
@@ -34,6 +34,13 @@ from kagent.core.a2a import (
 
 from ._metadata_utils import get_rich_event_metadata
 
+_FUNCTION_CALL_METADATA = {
+    get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL,
+}
+_FUNCTION_RESPONSE_METADATA = {
+    get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_RESPONSE,
+}
+
 
 async def _convert_langgraph_event_to_a2a(
     langgraph_event: dict[str, Any],
@@ -47,21 +54,25 @@ async def _convert_langgraph_event_to_a2a(
     Deduplicates messages using sent_message_ids to avoid replaying history.
     """
     a2a_events: list[TaskStatusUpdateEvent] = []
+    now = datetime.now(UTC).isoformat()
+    # Identical for every update emitted from this graph event; validation copies it per event
+    event_metadata = get_rich_event_metadata(app_name=app_name, session_id=context_id)
 
     # LangGraph events have node names as keys, with 'messages' as values
     # Example: {'agent': {'messages': [AIMessage(...)]}}
-    for node_name, node_data in langgraph_event.items():
-        if not isinstance(node_data, dict) or "messages" not in node_data:
+    for node_data in langgraph_event.values():
+        if not isinstance(node_data, dict):
             continue
-        messages = node_data["messages"]
+        messages = node_data.get("messages")
         if not isinstance(messages, list):
             continue
 
         for message in messages:
             # Deduplicate using content hash (message.id is often None)
             msg_content = f"{type(message).__name__}:{message.content}"
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                msg_content += f":tools:{len(message.tool_calls)}"
+            tool_calls = getattr(message, "tool_calls", None)
+            if tool_calls:
+                msg_content += f":tools:{len(tool_calls)}"
             msg_id = hashlib.md5(msg_content.encode()).hexdigest()
 
             if msg_id in sent_message_ids:
@@ -70,14 +81,14 @@ async def _convert_langgraph_event_to_a2a(
 
             if isinstance(message, AIMessage):
                 # Handle AI messages (assistant responses)
-                a2a_message = Message(message_id=str(uuid.uuid4()), role=Role.agent, parts=[])
+                parts: list[Part] = []
                 if message.content and isinstance(message.content, str) and message.content.strip():
-                    a2a_message.parts.append(Part(TextPart(text=message.content)))
+                    parts.append(Part(TextPart(text=message.content)))
 
                 # Handle tool calls in AI messages
-                if hasattr(message, "tool_calls") and message.tool_calls:
-                    for tool_call in message.tool_calls:
-                        a2a_message.parts.append(
+                if tool_calls:
+                    for tool_call in tool_calls:
+                        parts.append(
                             Part(
                                 DataPart(
                                     data={
@@ -85,33 +96,27 @@ async def _convert_langgraph_event_to_a2a(
                                         "name": tool_call["name"],
                                         "args": tool_call["args"],
                                     },
-                                    metadata={
-                                        get_kagent_metadata_key(
-                                            A2A_DATA_PART_METADATA_TYPE_KEY
-                                        ): A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL,
-                                    },
+                                    metadata=_FUNCTION_CALL_METADATA,
                                 )
                             )
                         )
 
                 # Only send message if it has parts (content or tool calls)
-                if not a2a_message.parts:
+                if not parts:
                     continue
+                a2a_message = Message(message_id=uuid.uuid4().hex, role=Role.agent, parts=parts)
 
                 a2a_events.append(
                     TaskStatusUpdateEvent(
                         task_id=task_id,
                         status=TaskStatus(
                             state=TaskState.working,
-                            timestamp=datetime.now(UTC).isoformat(),
+                            timestamp=now,
                             message=a2a_message,
                         ),
                         context_id=context_id,
                         final=False,
-                        metadata=get_rich_event_metadata(
-                            app_name=app_name,
-                            session_id=context_id,
-                        ),
+                        metadata=event_metadata,
                     )
                 )
 
@@ -123,9 +128,9 @@ async def _convert_langgraph_event_to_a2a(
                             task_id=task_id,
                             status=TaskStatus(
                                 state=TaskState.working,
-                                timestamp=datetime.now(UTC).isoformat(),
+                                timestamp=now,
                                 message=Message(
-                                    message_id=str(uuid.uuid4()),
+                                    message_id=uuid.uuid4().hex,
                                     role=Role.agent,
                                     parts=[
                                         Part(
@@ -135,11 +140,7 @@ async def _convert_langgraph_event_to_a2a(
                                                     "name": message.name,
                                                     "response": message.content,
                                                 },
-                                                metadata={
-                                                    get_kagent_metadata_key(
-                                                        A2A_DATA_PART_METADATA_TYPE_KEY
-                                                    ): A2A_DATA_PART_METADATA_TYPE_FUNCTION_RESPONSE,
-                                                },
+                                                metadata=_FUNCTION_RESPONSE_METADATA,
                                             )
                                         )
                                     ],
@@ -147,10 +148,7 @@ async def _convert_langgraph_event_to_a2a(
                             ),
                             context_id=context_id,
                             final=False,
-                            metadata=get_rich_event_metadata(
-                                app_name=app_name,
-                                session_id=context_id,
-                            ),
+                            metadata=event_metadata,
                         )
                     )
 
@@ -30,6 +30,7 @@ from pydantic import BaseModel
 
 from kagent.core.a2a import (
     KAGENT_HITL_DECISION_TYPE_DENY,
+    DecisionType,
     TaskResultAggregator,
     ToolApprovalRequest,
     extract_decision_from_message,
@@ -269,30 +270,31 @@ class LangGraphAgentExecutor(AgentExecutor):
         # TODO: Implement proper cancellation logic if needed
         raise NotImplementedError("Cancellation is not implemented")
 
-    def _is_resume_command(self, context: RequestContext) -> bool:
-        """Check if message is a resume command for an interrupted task.
+    def _get_resume_decision(self, context: RequestContext) -> DecisionType | None:
+        """Return the user's decision if message is a resume command for an interrupted task.
 
         Uses generic utilities from kagent-core for decision extraction.
         """
         # Must have an existing task in input_required state to resume
         if not context.current_task:
-            return False
+            return None
 
         if not is_input_required_task(context.current_task.status.state):
-            return False
+            return None
 
         # Check if message contains a decision
-        decision = extract_decision_from_message(context.message)
-        return decision is not None
+        return extract_decision_from_message(context.message)
 
     async def _handle_resume(
         self,
         context: RequestContext,
         event_queue: EventQueue,
+        decision_type: DecisionType | None = None,
     ) -> None:
         """Resume graph execution after interrupt with user decision."""
-        # Extract decision from message using core utility
-        decision_type = extract_decision_from_message(context.message)
+        # Extract decision from message using core utility, unless the caller already did
+        if decision_type is None:
+            decision_type = extract_decision_from_message(context.message)
 
         if not decision_type:
             # Security: Default to deny if decision cannot be determined
@@ -405,9 +407,9 @@ class LangGraphAgentExecutor(AgentExecutor):
         try:
             # Check if this is a resume command (check before current_task check)
             # Resume commands can come as new messages to continue interrupted tasks
-            if self._is_resume_command(context):
+            if (decision := self._get_resume_decision(context)) is not None:
                 logger.info(f"Resuming task {context.task_id} after interrupt")
-                await self._handle_resume(context, event_queue)
+                await self._handle_resume(context, event_queue, decision)
                 return
 
             # Send task submitted event for new tasks
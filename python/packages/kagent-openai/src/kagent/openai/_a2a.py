@@ -10,6 +10,7 @@ import faulthandler
 import logging
 import os
 from collections.abc import Callable
+from contextlib import asynccontextmanager
 
 import httpx
 from a2a.server.apps import A2AFastAPIApplication
@@ -18,10 +19,11 @@ from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard
 from agents import Agent, set_default_openai_api, set_default_openai_client, set_tracing_disabled
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import PlainTextResponse
 from opentelemetry.instrumentation.openai_agents import OpenAIAgentsInstrumentor
 
-from kagent.core import KAgentConfig, configure_tracing
+from kagent.core import KAGENT_HTTP_TIMEOUT, KAgentConfig, configure_tracing
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -46,10 +48,14 @@ def configure_logging() -> None:
 
 configure_logging()
 
+# Enable fault handler once for the process
+if not faulthandler.is_enabled():
+    faulthandler.enable()
 
-def health_check(request: Request) -> PlainTextResponse:
-    """Health check endpoint."""
-    return PlainTextResponse("OK")
+
+# Health check endpoint. A Response instance is itself an ASGI app, so Starlette
+# serves it directly without building a Request or running a handler per probe.
+health_check = PlainTextResponse("OK")
 
 
 def thread_dump(request: Request) -> PlainTextResponse:
@@ -66,6 +72,9 @@ def thread_dump(request: Request) -> PlainTextResponse:
 kagent_url_override = os.getenv("KAGENT_URL")
 sts_well_known_uri = os.getenv("STS_WELL_KNOWN_URI")
 
+# Connection pool settings for the KAgent backend client
+_KAGENT_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
 
 def _configure_openai_client() -> None:
     """
@@ -88,6 +97,17 @@ def _configure_openai_client() -> None:
         logger.info(f"Configured OpenAI client with base URL: {openai_api_base}")
 
 
+def _http_client_lifespan(http_client: httpx.AsyncClient):
+    """Returns a lifespan that closes the shared HTTP client on shutdown."""
+
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI):
+        yield
+        await http_client.aclose()
+
+    return _lifespan
+
+
 class KAgentApp:
     """FastAPI application builder for OpenAI Agents SDK with KAgent integration."""
 
@@ -128,9 +148,11 @@ class KAgentApp:
         """
         _configure_openai_client()
 
-        # Create HTTP client with KAgent backend
+        # Create HTTP client with KAgent backend, shared for the app lifetime
         http_client = httpx.AsyncClient(
             base_url=kagent_url_override or self.config.kagent_url,
+            limits=_KAGENT_HTTP_LIMITS,
+            timeout=KAGENT_HTTP_TIMEOUT,
         )
 
         # Create session factory
@@ -166,11 +188,9 @@ class KAgentApp:
             max_content_length=max_content_length,
         )
 
-        # Enable fault handler
-        faulthandler.enable()
-
         # Create FastAPI app with lifespan
-        app = FastAPI()
+        app = FastAPI(lifespan=_http_client_lifespan(http_client))
+        app.add_middleware(GZipMiddleware, minimum_size=1024)
 
         if self.tracing:
             try:
@@ -239,11 +259,9 @@ class KAgentApp:
             max_content_length=max_content_length,
         )
 
-        # Enable fault handler
-        faulthandler.enable()
-
         # Create FastAPI app
         app = FastAPI()
+        app.add_middleware(GZipMiddleware, minimum_size=1024)
 
         # Add health check endpoints
         app.add_route("/health", methods=["GET"], route=health_check)
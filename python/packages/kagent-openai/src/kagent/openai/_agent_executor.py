@@ -30,7 +30,7 @@ from a2a.types import (
 )
 from agents.agent import Agent
 from agents.run import Runner
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from kagent.core.a2a import TaskResultAggregator, get_kagent_metadata_key
 
@@ -39,10 +39,24 @@ from ._session_service import KAgentSession
 
 logger = logging.getLogger(__name__)
 
+# Metadata keys attached to emitted events, resolved once at import time
+_APP_NAME_KEY = get_kagent_metadata_key("app_name")
+_SESSION_ID_KEY = get_kagent_metadata_key("session_id")
+_USER_ID_KEY = get_kagent_metadata_key("user_id")
+_ERROR_TYPE_KEY = get_kagent_metadata_key("error_type")
+_ERROR_DETAIL_KEY = get_kagent_metadata_key("error_detail")
+
+# Fixed message parts reused across failed-task events. Message validation copies the
+# list, and the Part models themselves are never mutated after being enqueued.
+_TIMEOUT_PARTS = [Part(TextPart(text="Execution timed out"))]
+
 
 class OpenAIAgentExecutorConfig(BaseModel):
     """Configuration for the OpenAIAgentExecutor."""
 
+    # Shared by every task the executor runs, so keep it immutable
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # Maximum time to wait for agent execution (seconds)
     execution_timeout: float = 300.0
 
@@ -111,14 +125,19 @@ class OpenAIAgentExecutor(AgentExecutor):
                 context=session_context,
             )
 
+            # Bind values read for every streamed event to locals
+            task_id = context.task_id
+            context_id = context.context_id
+            app_name = self.app_name
+
             # Process streaming events
             async for event in result.stream_events():
                 # Convert OpenAI event to A2A events
                 a2a_events = convert_openai_event_to_a2a_events(
                     event,
-                    context.task_id,
-                    context.context_id,
-                    self.app_name,
+                    task_id,
+                    context_id,
+                    app_name,
                 )
 
                 for a2a_event in a2a_events:
@@ -126,11 +145,12 @@ class OpenAIAgentExecutor(AgentExecutor):
                     await event_queue.enqueue_event(a2a_event)
 
             # Handle final output
-            if hasattr(result, "final_output") and result.final_output:
+            final_output = getattr(result, "final_output", None)
+            if final_output:
                 final_message = Message(
-                    message_id=str(uuid.uuid4()),
+                    message_id=uuid.uuid4().hex,
                     role=Role.agent,
-                    parts=[Part(TextPart(text=str(result.final_output)))],
+                    parts=[Part(TextPart(text=str(final_output)))],
                 )
 
                 # Publish final artifact
@@ -139,8 +159,8 @@ class OpenAIAgentExecutor(AgentExecutor):
                         task_id=context.task_id,
                         last_chunk=True,
                         context_id=context.context_id,
-                        artifact=Artifact(
-                            artifact_id=str(uuid.uuid4()),
+                        artifact=Artifact.model_construct(
+                            artifact_id=uuid.uuid4().hex,
                             parts=final_message.parts,
                         ),
                     )
@@ -170,8 +190,8 @@ class OpenAIAgentExecutor(AgentExecutor):
                             task_id=context.task_id,
                             last_chunk=True,
                             context_id=context.context_id,
-                            artifact=Artifact(
-                                artifact_id=str(uuid.uuid4()),
+                            artifact=Artifact.model_construct(
+                                artifact_id=uuid.uuid4().hex,
                                 parts=task_result_aggregator.task_status_message.parts,
                             ),
                         )
@@ -221,6 +241,9 @@ class OpenAIAgentExecutor(AgentExecutor):
         if not context.message:
             raise ValueError("A2A request must have a message")
 
+        # The submitted and working events are emitted back to back, share one timestamp
+        now = datetime.now(UTC).isoformat()
+
         # Send task submitted event for new tasks
         if not context.current_task:
             await event_queue.enqueue_event(
@@ -229,7 +252,7 @@ class OpenAIAgentExecutor(AgentExecutor):
                     status=TaskStatus(
                         state=TaskState.submitted,
                         message=context.message,
-                        timestamp=datetime.now(UTC).isoformat(),
+                        timestamp=now,
                     ),
                     context_id=context.context_id,
                     final=False,
@@ -246,14 +269,14 @@ class OpenAIAgentExecutor(AgentExecutor):
                 task_id=context.task_id,
                 status=TaskStatus(
                     state=TaskState.working,
-                    timestamp=datetime.now(UTC).isoformat(),
+                    timestamp=now,
                 ),
                 context_id=context.context_id,
                 final=False,
                 metadata={
-                    get_kagent_metadata_key("app_name"): self.app_name,
-                    get_kagent_metadata_key("session_id"): session_id,
-                    get_kagent_metadata_key("user_id"): user_id,
+                    _APP_NAME_KEY: self.app_name,
+                    _SESSION_ID_KEY: session_id,
+                    _USER_ID_KEY: user_id,
                 },
             )
         )
@@ -291,9 +314,9 @@ class OpenAIAgentExecutor(AgentExecutor):
                         state=TaskState.failed,
                         timestamp=datetime.now(UTC).isoformat(),
                         message=Message(
-                            message_id=str(uuid.uuid4()),
+                            message_id=uuid.uuid4().hex,
                             role=Role.agent,
-                            parts=[Part(TextPart(text="Execution timed out"))],
+                            parts=_TIMEOUT_PARTS,
                         ),
                     ),
                     context_id=context.context_id,
@@ -312,20 +335,20 @@ class OpenAIAgentExecutor(AgentExecutor):
                         state=TaskState.failed,
                         timestamp=datetime.now(UTC).isoformat(),
                         message=Message(
-                            message_id=str(uuid.uuid4()),
+                            message_id=uuid.uuid4().hex,
                             role=Role.agent,
                             parts=[Part(TextPart(text=f"Execution failed: {error_message}"))],
                             metadata={
-                                get_kagent_metadata_key("error_type"): type(e).__name__,
-                                get_kagent_metadata_key("error_detail"): error_message,
+                                _ERROR_TYPE_KEY: type(e).__name__,
+                                _ERROR_DETAIL_KEY: error_message,
                             },
                         ),
                     ),
                     context_id=context.context_id,
                     final=True,
                     metadata={
-                        get_kagent_metadata_key("error_type"): type(e).__name__,
-                        get_kagent_metadata_key("error_detail"): error_message,
+                        _ERROR_TYPE_KEY: type(e).__name__,
+                        _ERROR_DETAIL_KEY: error_message,
                     },
                 )
             )
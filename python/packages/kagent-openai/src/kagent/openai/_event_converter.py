@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 
 from a2a.server.events import Event as A2AEvent
@@ -38,6 +39,17 @@ from kagent.core.a2a import (
 
 logger = logging.getLogger(__name__)
 
+_APP_NAME_KEY = get_kagent_metadata_key("app_name")
+_EVENT_TYPE_KEY = get_kagent_metadata_key("event_type")
+_NEW_AGENT_NAME_KEY = get_kagent_metadata_key("new_agent_name")
+
+_FUNCTION_CALL_METADATA = {
+    get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL,
+}
+_FUNCTION_RESPONSE_METADATA = {
+    get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_RESPONSE,
+}
+
 
 def convert_openai_event_to_a2a_events(
     event: StreamEvent,
@@ -59,22 +71,13 @@ def convert_openai_event_to_a2a_events(
     a2a_events: list[A2AEvent] = []
 
     try:
-        # Handle RunItemStreamEvent (messages, tool calls, tool outputs)
-        if isinstance(event, RunItemStreamEvent):
-            a2a_events.extend(_convert_run_item_event(event, task_id, context_id, app_name))
-
-        # Handle RawResponsesStreamEvent (raw LLM responses)
-        elif isinstance(event, RawResponsesStreamEvent):
-            # These are low-level events - can be logged but not converted
-            logger.debug(f"Raw response event: {event.data}")
-
-        # Handle AgentUpdatedStreamEvent (agent handoffs)
-        elif isinstance(event, AgentUpdatedStreamEvent):
-            a2a_events.extend(_convert_agent_updated_event(event, task_id, context_id, app_name))
+        converter = _EVENT_CONVERTERS.get(type(event))
+        if converter is not None:
+            a2a_events.extend(converter(event, task_id, context_id, app_name))
 
         # Other event types
         else:
-            logger.debug(f"Unhandled event type: {type(event).__name__}")
+            logger.debug("Unhandled event type: %s", type(event).__name__)
 
     except Exception as e:
         logger.error(f"Error converting OpenAI event to A2A: {e}", exc_info=True)
@@ -100,22 +103,28 @@ def _convert_run_item_event(
     Returns:
         List containing A2A events based on the item type
     """
-    # Handle message output
-    if isinstance(event.item, MessageOutputItem):
-        return _convert_message_output(event.item, task_id, context_id, app_name)
+    item = event.item
+    converter = _RUN_ITEM_CONVERTERS.get(type(item))
+    if converter is not None:
+        return converter(item, task_id, context_id, app_name)
 
-    # Handle tool calls
-    elif isinstance(event.item, ToolCallItem):
-        return _convert_tool_call(event.item, task_id, context_id, app_name)
+    # Other item types
+    logger.debug("Unhandled run item type: %s", type(item).__name__)
+    return []
 
-    # Handle tool outputs
-    elif isinstance(event.item, ToolCallOutputItem):
-        return _convert_tool_output(event.item, task_id, context_id, app_name)
 
-    # Other item types
-    else:
-        logger.debug(f"Unhandled run item type: {type(event.item).__name__}")
-        return []
+def _convert_raw_response_event(
+    event: RawResponsesStreamEvent,
+    task_id: str,
+    context_id: str,
+    app_name: str,
+) -> list[A2AEvent]:
+    """Log a raw LLM response event.
+
+    These are low-level events - they can be logged but are not converted.
+    """
+    logger.debug("Raw response event: %s", event.data)
+    return []
 
 
 def _convert_message_output(
@@ -135,43 +144,47 @@ def _convert_message_output(
     raw_message = item.raw_item
 
     # Iterate through content parts
-    if hasattr(raw_message, "content") and raw_message.content:
-        if isinstance(raw_message.content, str):
-            text_parts.append(raw_message.content)
+    content = getattr(raw_message, "content", None)
+    if content:
+        if isinstance(content, str):
+            text_parts.append(content)
         else:
-            for part in raw_message.content:
+            # Bound once so the per-part loop avoids an attribute lookup on each append
+            append = text_parts.append
+            for part in content:
                 # Check if this is a text part (ResponseOutputText has 'text' field)
-                if hasattr(part, "text"):
-                    text_parts.append(part.text)
+                text = getattr(part, "text", None)
+                if text is not None:
+                    append(text)
                 # Otherwise, it is ResponseOutputRefusal and the model will explain why
-                elif hasattr(part, "refusal"):
-                    text_parts.append(f"[Refusal] {part.refusal}")
+                elif (refusal := getattr(part, "refusal", None)) is not None:
+                    append(f"[Refusal] {refusal}")
 
     if not text_parts:
         return []
 
     text_content = "".join(text_parts)
 
-    message = Message(
-        message_id=str(uuid.uuid4()),
+    message = Message.model_construct(
+        message_id=uuid.uuid4().hex,
         role=Role.agent,
-        parts=[A2APart(TextPart(text=text_content))],
+        parts=[A2APart.model_construct(root=TextPart.model_construct(text=text_content))],
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
-            get_kagent_metadata_key("event_type"): "message_output",
+            _APP_NAME_KEY: app_name,
+            _EVENT_TYPE_KEY: "message_output",
         },
     )
 
-    status_event = TaskStatusUpdateEvent(
+    status_event = TaskStatusUpdateEvent.model_construct(
         task_id=task_id,
         context_id=context_id,
-        status=TaskStatus(
+        status=TaskStatus.model_construct(
             state=TaskState.working,
             message=message,
             timestamp=datetime.now(UTC).isoformat(),
         ),
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
+            _APP_NAME_KEY: app_name,
         },
         final=False,
     )
@@ -196,23 +209,18 @@ def _convert_tool_call(
     raw_call = item.raw_item
 
     # Extract tool call details from the raw item (fields are at top level)
-    tool_name = raw_call.name if hasattr(raw_call, "name") else "unknown"
-    call_id = (
-        raw_call.call_id
-        if hasattr(raw_call, "call_id")
-        else (raw_call.id if hasattr(raw_call, "id") else str(uuid.uuid4()))
-    )
+    tool_name = getattr(raw_call, "name", "unknown")
+    call_id = getattr(raw_call, "call_id", None) or getattr(raw_call, "id", None) or str(uuid.uuid4())
     tool_arguments = {}
 
     # Arguments are a JSON string, need to parse them
-    if hasattr(raw_call, "arguments"):
+    arguments = getattr(raw_call, "arguments", None)
+    if arguments is not None:
         try:
-            tool_arguments = (
-                json.loads(raw_call.arguments) if isinstance(raw_call.arguments, str) else raw_call.arguments
-            )
+            tool_arguments = json.loads(arguments) if isinstance(arguments, str) else arguments
         except (json.JSONDecodeError, TypeError):
-            logger.warning(f"Failed to parse arguments: {raw_call.arguments}")
-            tool_arguments = {"raw": str(raw_call.arguments)}
+            logger.warning(f"Failed to parse arguments: {arguments}")
+            tool_arguments = {"raw": str(arguments)}
 
     # Create a DataPart for the function call
     # Note: Frontend expects 'args' not 'arguments', and 'id' for the call ID
@@ -222,33 +230,31 @@ def _convert_tool_call(
         "args": tool_arguments,
     }
 
-    data_part = DataPart(
+    data_part = DataPart.model_construct(
         data=function_data,
-        metadata={
-            get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL,
-        },
+        metadata=dict(_FUNCTION_CALL_METADATA),
     )
 
-    message = Message(
-        message_id=str(uuid.uuid4()),
+    message = Message.model_construct(
+        message_id=uuid.uuid4().hex,
         role=Role.agent,
-        parts=[A2APart(data_part)],
+        parts=[A2APart.model_construct(root=data_part)],
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
-            get_kagent_metadata_key("event_type"): "tool_call",
+            _APP_NAME_KEY: app_name,
+            _EVENT_TYPE_KEY: "tool_call",
         },
     )
 
-    status_event = TaskStatusUpdateEvent(
+    status_event = TaskStatusUpdateEvent.model_construct(
         task_id=task_id,
         context_id=context_id,
-        status=TaskStatus(
+        status=TaskStatus.model_construct(
             state=TaskState.working,
             message=message,
             timestamp=datetime.now(UTC).isoformat(),
         ),
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
+            _APP_NAME_KEY: app_name,
         },
         final=False,
     )
@@ -271,7 +277,7 @@ def _convert_tool_output(
     raw_output = item.raw_item
 
     # Extract tool output details from the raw item
-    call_id = raw_output.call_id if hasattr(raw_output, "call_id") else str(uuid.uuid4())
+    call_id = getattr(raw_output, "call_id", None) or str(uuid.uuid4())
 
     # item.output is the actual return value (Any)
     actual_output: str = item.output
@@ -283,33 +289,31 @@ def _convert_tool_output(
         "response": {"result": actual_output},
     }
 
-    data_part = DataPart(
+    data_part = DataPart.model_construct(
         data=function_data,
-        metadata={
-            get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_RESPONSE,
-        },
+        metadata=dict(_FUNCTION_RESPONSE_METADATA),
     )
 
-    message = Message(
-        message_id=str(uuid.uuid4()),
+    message = Message.model_construct(
+        message_id=uuid.uuid4().hex,
         role=Role.agent,
-        parts=[A2APart(data_part)],
+        parts=[A2APart.model_construct(root=data_part)],
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
-            get_kagent_metadata_key("event_type"): "tool_output",
+            _APP_NAME_KEY: app_name,
+            _EVENT_TYPE_KEY: "tool_output",
         },
     )
 
-    status_event = TaskStatusUpdateEvent(
+    status_event = TaskStatusUpdateEvent.model_construct(
         task_id=task_id,
         context_id=context_id,
-        status=TaskStatus(
+        status=TaskStatus.model_construct(
             state=TaskState.working,
             message=message,
             timestamp=datetime.now(UTC).isoformat(),
         ),
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
+            _APP_NAME_KEY: app_name,
         },
         final=False,
     )
@@ -340,36 +344,50 @@ def _convert_agent_updated_event(
         "args": {"target_agent": agent_name},
     }
 
-    data_part = DataPart(
+    data_part = DataPart.model_construct(
         data=function_data,
-        metadata={
-            get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY): A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL,
-        },
+        metadata=dict(_FUNCTION_CALL_METADATA),
     )
 
-    message = Message(
-        message_id=str(uuid.uuid4()),
+    message = Message.model_construct(
+        message_id=uuid.uuid4().hex,
         role=Role.agent,
-        parts=[A2APart(data_part)],
+        parts=[A2APart.model_construct(root=data_part)],
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
-            get_kagent_metadata_key("event_type"): "agent_handoff",
-            get_kagent_metadata_key("new_agent_name"): agent_name,
+            _APP_NAME_KEY: app_name,
+            _EVENT_TYPE_KEY: "agent_handoff",
+            _NEW_AGENT_NAME_KEY: agent_name,
         },
     )
 
-    status_event = TaskStatusUpdateEvent(
+    status_event = TaskStatusUpdateEvent.model_construct(
         task_id=task_id,
         context_id=context_id,
-        status=TaskStatus(
+        status=TaskStatus.model_construct(
             state=TaskState.working,
             message=message,
             timestamp=datetime.now(UTC).isoformat(),
         ),
         metadata={
-            get_kagent_metadata_key("app_name"): app_name,
+            _APP_NAME_KEY: app_name,
         },
         final=False,
     )
 
     return [status_event]
+
+
+# Converters keyed by exact event/item type, so each event costs a single dict
+# lookup instead of walking an isinstance chain. The SDK's event and item
+# classes are plain dataclasses that are not subclassed.
+_EVENT_CONVERTERS: dict[type, Callable[..., list[A2AEvent]]] = {
+    RunItemStreamEvent: _convert_run_item_event,
+    RawResponsesStreamEvent: _convert_raw_response_event,
+    AgentUpdatedStreamEvent: _convert_agent_updated_event,
+}
+
+_RUN_ITEM_CONVERTERS: dict[type, Callable[..., list[A2AEvent]]] = {
+    MessageOutputItem: _convert_message_output,
+    ToolCallItem: _convert_tool_call,
+    ToolCallOutputItem: _convert_tool_output,
+}
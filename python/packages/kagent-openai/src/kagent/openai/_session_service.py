@@ -6,7 +6,11 @@ storing session data in the KAgent backend via REST API.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import uuid
+from datetime import UTC, datetime
 
 import httpx
 from agents.items import TResponseInputItem
@@ -43,9 +47,23 @@ class KAgentSession(SessionABC):
         self.app_name = app_name
         self.user_id = user_id
         self._items_cache: list[TResponseInputItem] | None = None
+        # Set once the backend session is known to exist, so add_items only checks once
+        self._session_exists = False
+        self._session_lock = asyncio.Lock()
 
     async def _ensure_session_exists(self) -> None:
         """Ensure the session exists in KAgent backend, creating if needed."""
+        if self._session_exists:
+            return
+
+        # Concurrent callers wait on the first check instead of each issuing their own
+        async with self._session_lock:
+            if not self._session_exists:
+                await self._check_or_create_session()
+                self._session_exists = True
+
+    async def _check_or_create_session(self) -> None:
+        """Look up the session in KAgent backend and create it if it is missing."""
         try:
             # Try to get the session
             response = await self.client.get(
@@ -82,7 +100,7 @@ class KAgentSession(SessionABC):
         if not data.get("data"):
             raise RuntimeError(f"Failed to create session: {data.get('message', 'Unknown error')}")
 
-        logger.debug(f"Created session {self.session_id} for user {self.user_id}")
+        logger.debug("Created session %s for user %s", self.session_id, self.user_id)
 
     async def get_items(self, limit: int | None = None) -> list[TResponseInputItem]:
         """Retrieve conversation history for this session.
@@ -125,8 +143,6 @@ class KAgentSession(SessionABC):
                 event_json = event_data.get("data")
                 if event_json:
                     # Parse the event and extract items if they exist
-                    import json
-
                     try:
                         event_obj = json.loads(event_json)
                         # Look for items in the event
@@ -161,10 +177,6 @@ class KAgentSession(SessionABC):
         await self._ensure_session_exists()
 
         # Store items as an event in the session
-        import json
-        import uuid
-        from datetime import UTC, datetime
-
         event_data = {
             "id": str(uuid.uuid4()),
             "data": json.dumps(
@@ -187,7 +199,7 @@ class KAgentSession(SessionABC):
         if self._items_cache is not None:
             self._items_cache.extend(items)
 
-        logger.debug(f"Added {len(items)} items to session {self.session_id}")
+        logger.debug("Added %d items to session %s", len(items), self.session_id)
 
     async def pop_item(self) -> TResponseInputItem | None:
         """Remove and return the most recent item from this session.
@@ -228,13 +240,15 @@ class KAgentSession(SessionABC):
 
             # Clear cache
             self._items_cache = None
+            self._session_exists = False
 
-            logger.debug(f"Cleared session {self.session_id}")
+            logger.debug("Cleared session %s", self.session_id)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 # Session doesn't exist, that's fine
                 self._items_cache = None
+                self._session_exists = False
             else:
                 raise
 
@@ -6,12 +6,12 @@ def generate_skills_xml(skills: list[Skill]) -> str:
     if not skills:
         return "<available_skills>\n<!-- No skills found -->\n</available_skills>"
 
-    skills_entries = []
-    for skill in skills:
-        skill_xml = f"<skill>\n<name>{skill.name}</name>\n<description>{skill.description}</description>\n</skill>"
-        skills_entries.append(skill_xml)
+    skills_entries = "\n".join(
+        f"<skill>\n<name>{skill.name}</name>\n<description>{skill.description}</description>\n</skill>"
+        for skill in skills
+    )
 
-    return "<available_skills>\n" + "\n".join(skills_entries) + "\n</available_skills>"
+    return f"<available_skills>\n{skills_entries}\n</available_skills>"
 
 
 def generate_skills_tool_description(skills: list[Skill]) -> str: